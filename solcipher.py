@@ -2,7 +2,7 @@
 import argparse
 import re
 import sys
-from typing import Generator, List, Union
+from typing import Callable, Generator, List, Union
 
 # Default standard deck order (space-separated tokens)
 default_line = (
@@ -53,12 +53,43 @@ REV_SUITS = _flip(SUITS) | _flip(SUITS_UNI)
 REV_VALUES = _flip(VALUES)
 
 
+class _DropUnmapped(dict):
+    """str.translate table that deletes any character it has no entry for."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+# Clean-and-uppercase in a single C-level pass: A–Z map to themselves,
+# a–z to their uppercase forms, everything else is dropped.
+_CLEAN = _DropUnmapped({c: c for c in range(65, 91)})
+_CLEAN.update({c: c - 32 for c in range(97, 123)})
+
+
+# Direct lookup for every legal two-character token (rank + suit in any
+# accepted case/symbol form) plus the jokers; built once at import so
+# read_card avoids two regex scans per token on the common path.
+TOKEN_TO_CODE = {
+    rank + suit: 13 * (si % 4) + ri + 1
+    for si, suit in enumerate(SUITS + SUITS.upper() + SUITS_UNI)
+    for ri, rank in enumerate(VALUES)
+}
+TOKEN_TO_CODE.update(REV_JOKERS)
+
+# Compiled once at import: re caches patterns, but the cache lookup per
+# call is not free and these run for every token of a custom deck.
+_RANK_RE = re.compile(r'[A23456789TJQK]')
+_SUIT_RE = re.compile(r'[cdhsCDHS\u2663\u2666\u2665\u2660]')
+_DECK_CLEAN_RE = re.compile(r'[^AB2-9TJQKcdhsCDHS\u2663\u2666\u2665\u2660\s]')
+
+
 def read_card(token: str) -> int:
     """Parse a single card token into its numeric code 1–54."""
-    if token in REV_JOKERS:
-        return REV_JOKERS[token]
-    m_r = re.search(r'[A23456789TJQK]', token)
-    m_s = re.search(r'[cdhsCDHS\u2663\u2666\u2665\u2660]', token)
+    code = TOKEN_TO_CODE.get(token)
+    if code is not None:
+        return code
+    m_r = _RANK_RE.search(token)
+    m_s = _SUIT_RE.search(token)
     if m_r and m_s:
         rank = m_r.group(0).upper()
         suit = m_s.group(0).lower()
@@ -66,8 +97,25 @@ def read_card(token: str) -> int:
     raise ValueError(f"Invalid card token: {token}")
 
 
+# The reverse of TOKEN_TO_CODE for output: code -> printable token, one
+# table per suit alphabet, so card_writer is a dict hit per card.
+CODE_TO_TOKEN_ASCII = {
+    c: VALUES[(c - 1) % 13] + SUITS[(c - 1) // 13] for c in range(1, 53)
+}
+CODE_TO_TOKEN_ASCII.update(JOKERS)
+CODE_TO_TOKEN_UNI = {
+    c: VALUES[(c - 1) % 13] + SUITS_UNI[(c - 1) // 13] for c in range(1, 53)
+}
+CODE_TO_TOKEN_UNI.update(JOKERS)
+
+
 def card_writer(code: int, suits: str = SUITS) -> str:
     """Convert numeric code back to a single-character token."""
+    if suits == SUITS:
+        return CODE_TO_TOKEN_ASCII[code]
+    if suits == SUITS_UNI:
+        return CODE_TO_TOKEN_UNI[code]
+    # Custom suit glyphs (e.g. colorized): compute the token directly.
     if code in JOKERS:
         return JOKERS[code]
     rank = VALUES[(code - 1) % 13]
@@ -80,33 +128,123 @@ def combine_letters(a: str, b: str, sign: int = 1) -> str:
     Combine plaintext letter `a` with keystream letter `b`.
     `sign=1` for encryption, `sign=-1` for decryption.
     """
-    is_upper = a.isupper()
-    base = 65 if is_upper else 97
-    p0 = ord(a) - base
-    k1 = ord(b) - 64
-    c0 = (p0 + sign * k1) % 26
-    return chr(base + c0)
+    o = ord(a)
+    # ASCII cases differ only in bit 5, so `o & 0x60` is 64 for uppercase
+    # and 96 for lowercase: base follows without isupper() or a branch.
+    base = (o & 0x60) + 1
+    return chr(base + (o - base + sign * (ord(b) - 64)) % 26)
 
 
-def combine_text(text: str, key_gen: Generator[str, None, None], sign: int = 1) -> str:
+# Raw key code (0–25) for each counted card, so producing a key letter is
+# a table load instead of a modulo; index 0 and the jokers never occur.
+CARD_TO_CODE = bytes((c - 1) % 26 if c else 0 for c in range(53))
+
+
+# Every byte value that is not an ASCII letter, for bytes.translate deletion.
+_NON_LETTERS = bytes(
+    o for o in range(256) if not (65 <= o <= 90 or 97 <= o <= 122)
+)
+
+
+def _letter_bytes(text: str) -> bytearray:
+    """Byte values of the A–Z/a–z characters of `text`, in order."""
+    return bytearray(
+        text.encode('ascii', 'ignore').translate(None, _NON_LETTERS)
+    )
+
+
+def combine_text(
+    text: str,
+    key_gen: Union[Generator[str, None, None], Callable[[int], bytes]],
+    sign: int = 1
+) -> str:
     """
-    Transform only A–Z/a–z in `text` via keystream `key_gen`.
+    Transform only A–Z/a–z in `text` via keystream `key_gen` — either a
+    generator of key letters or a callable producing `n` raw 0–25 key
+    codes at once (like `Deck.key_stream_bytes`).
     Non-letters are dropped before processing.
     """
-    out: List[str] = []
-    for ch in text:
-        if 'A' <= ch <= 'Z' or 'a' <= ch <= 'z':
-            k = next(key_gen)
-            out.append(combine_letters(ch, k, sign))
-    return ''.join(out)
+    # Work on raw byte values in one pass: no per-letter chr/ord round-trips
+    # or combine_letters calls, just integer arithmetic on a bytearray.
+    buf = _letter_bytes(text)
+    if callable(key_gen):
+        keys = key_gen(len(buf))
+    else:
+        keys = bytes(ord(next(key_gen)) - 65 for _ in range(len(buf)))
+    for i, o in enumerate(buf):
+        base = (o & 0x60) + 1
+        buf[i] = base + (o - base + sign * (keys[i] + 1)) % 26
+    return buf.decode('ascii')
+
+
+def _shift_cut_kernel(
+    deck: bytearray, scratch: bytearray, pos: bytearray
+) -> tuple:
+    """
+    Run one full shift cut (joker moves, triple cut, count cut) directly on
+    the raw buffers, with all state in locals. Returns the (deck, scratch)
+    pair, which may have been swapped by the buffer-reusing cuts.
+    """
+    # Joker A down one, joker B down two
+    for code, steps in ((53, 1), (54, 2)):
+        for _ in range(steps):
+            if deck[53] == code:
+                deck.insert(0, deck.pop())
+                for i, c in enumerate(deck):
+                    pos[c] = i
+            i = pos[code]
+            j = i + 1
+            other = deck[j]
+            deck[i], deck[j] = other, code
+            pos[code], pos[other] = j, i
+
+    # Triple cut around the jokers
+    a, b = pos[53], pos[54]
+    if a > b:
+        a, b = b, a
+    m = 53 - b
+    scratch[:m] = deck[b + 1:]
+    scratch[m:m + b + 1 - a] = deck[a:b + 1]
+    scratch[m + b + 1 - a:] = deck[:a]
+    deck, scratch = scratch, deck
+
+    # Count cut by the bottom card, always 1..54 here, so no negative
+    # counts to normalize; cutting by 53 or 54 (a joker on the bottom)
+    # leaves the deck unchanged, so skip the copy entirely.
+    count = deck[53]
+    if count < 53:
+        m = 53 - count
+        scratch[:m] = deck[count:53]
+        scratch[m:53] = deck[:count]
+        scratch[53] = deck[53]
+        deck, scratch = scratch, deck
+
+    # Only the joker moves read `pos`, so one rebuild at the end suffices.
+    for i, c in enumerate(deck):
+        pos[c] = i
+    return deck, scratch
 
 
 class Deck:
     def __init__(self, cards: List[int], verbose: bool = False) -> None:
         if len(cards) != 54:
             raise ValueError("Deck must have 54 cards.")
-        self.deck = list(cards)
+        # Cards fit in uint8, so a bytearray keeps the deck in one compact
+        # buffer: slicing/concatenation is memcpy-backed and indexing yields
+        # plain ints without per-element boxing.
+        self.deck = bytearray(cards)
+        # Inverse permutation: pos[code] is the index of `code` in the deck,
+        # so joker lookups are O(1) instead of a 54-entry scan.
+        self.pos = bytearray(55)
+        self._reindex()
+        # Reusable 54-byte buffer for count_cut, swapped with the deck on
+        # each cut so no fresh deck-sized buffers are allocated per call.
+        self._scratch = bytearray(54)
         self.verbose = verbose
+        # Bind the quiet or tracing implementation once, so the common
+        # non-verbose path carries no logging branches at all.
+        self.shift_cut = self._shift_cut_verbose if verbose else self._shift_cut_quiet
+        self.count_cut = self._count_cut_verbose if verbose else self._count_cut_quiet
 
     @classmethod
     def create(cls, verbose: bool = False) -> "Deck":
@@ -114,10 +252,7 @@ class Deck:
 
     @classmethod
     def from_input(cls, inp: str, verbose: bool = False) -> "Deck":
-        tokens = re.sub(
-            r'[^AB2-9TJQKcdhsCDHS\u2663\u2666\u2665\u2660\s]',
-            '', inp
-        ).strip().split()
+        tokens = _DECK_CLEAN_RE.sub('', inp).strip().split()
         if len(tokens) != 54:
             raise ValueError(f"Found {len(tokens)} cards, expected 54.")
         vals = [read_card(t) for t in tokens]
@@ -127,8 +262,13 @@ class Deck:
 
     def add_password_letter(self, letter: str) -> "Deck":
         """Apply one passphrase letter to key-schedule."""
-        self.shift_cut()
         cnt = ord(letter.upper()) - 64
+        if cnt >= 54:
+            # Characters past the countable range ('{', '~', non-ASCII…)
+            # used to corrupt the deck via an overlong cut; reject them
+            # loudly rather than silently producing a different keystream.
+            raise ValueError(f"Invalid passphrase character: {letter!r}")
+        self.shift_cut()
         self.count_cut(cnt)
         return self
 
@@ -139,62 +279,106 @@ class Deck:
             deck.add_password_letter(ch)
         return deck
 
+    def _reindex(self) -> None:
+        """Rebuild `pos` from `deck` after a bulk rearrangement."""
+        for i, c in enumerate(self.deck):
+            self.pos[c] = i
+
     def search(self, code: int) -> int:
-        return self.deck.index(code)
+        return self.pos[code]
 
     def get_card(self, idx: int) -> int:
         return min(self.deck[idx], 53)
 
     def cycle_shift(self) -> None:
         self.deck.insert(0, self.deck.pop())
+        self._reindex()
 
     def swap_down(self, code: int) -> "Deck":
         if self.deck[-1] == code:
             self.cycle_shift()
-        i = self.search(code)
+        i = self.pos[code]
         j = (i + 1) % 54
-        self.deck[i], self.deck[j] = self.deck[j], self.deck[i]
+        other = self.deck[j]
+        self.deck[i], self.deck[j] = other, code
+        self.pos[code], self.pos[other] = j, i
         return self
 
-    def count_cut(self, count: int) -> "Deck":
-        x = self.deck[:count]
-        y = self.deck[count:-1]
-        z = [self.deck[-1]]
-        self.deck = y + x + z
-        if self.verbose:
-            print(f"Count cut ({count}):", end=' ')
-            self.print_state()
+    def _count_cut_quiet(self, count: int) -> "Deck":
+        if count < 0:
+            # The slice-based cut gave negative counts a well-defined
+            # rotation (deck[:count] wraps around), equivalent to
+            # count % 54; at or below -54 the slices moved nothing.
+            # add_password_letter reaches this for every passphrase
+            # character below 'A', such as digits and spaces.
+            count = count % 54 if count > -54 else 0
+        # Counts of 0 and 53 rotate the block above the bottom card back to
+        # where it started, so skipping them is a pure no-op. Counts of 54+
+        # are also skipped, but deliberately NOT as a no-op: the slice-based
+        # cut grew the deck to 55 cards there, corrupting it, so refusing
+        # the cut is a behavior change in favor of keeping the deck intact
+        # (add_password_letter rejects such characters up front).
+        if 0 < count < 53:
+            deck = self.deck
+            scratch = self._scratch
+            m = 53 - count
+            scratch[:m] = deck[count:53]
+            scratch[m:53] = deck[:count]
+            scratch[53] = deck[53]
+            self.deck, self._scratch = scratch, deck
+            self._reindex()
         return self
 
-    def shift_cut(self) -> "Deck":
-        if self.verbose:
-            print("=== ShiftCut Start ===")
-            print("Before:", end=' ')
-            self.print_state()
+    def _count_cut_verbose(self, count: int) -> "Deck":
+        self._count_cut_quiet(count)
+        print(f"Count cut ({count}):", end=' ')
+        self.print_state()
+        return self
 
-        # Joker A down one
-        self.swap_down(REV_JOKERS['A'])
-        if self.verbose:
-            print("After A swap:", end=' ')
-            self.print_state()
+    def _shift_cut_quiet(self) -> "Deck":
+        self.deck, self._scratch = _shift_cut_kernel(
+            self.deck, self._scratch, self.pos
+        )
+        return self
 
-        # Joker B down two
-        self.swap_down(REV_JOKERS['B']).swap_down(REV_JOKERS['B'])
-        if self.verbose:
-            print("After B swaps:", end=' ')
+    def _shift_cut_verbose(self) -> "Deck":
+        print("=== ShiftCut Start ===")
+        print("Before:", end=' ')
+        self.print_state()
+
+        # Joker A down one, joker B down two, with swap_down inlined so the
+        # whole shuffle runs on local buffer references instead of method
+        # calls and attribute loads.
+        deck = self.deck
+        pos = self.pos
+        for code, steps, label in (
+            (53, 1, "After A swap:"),
+            (54, 2, "After B swaps:"),
+        ):
+            for _ in range(steps):
+                if deck[53] == code:
+                    deck.insert(0, deck.pop())
+                    for i, c in enumerate(deck):
+                        pos[c] = i
+                i = pos[code]
+                j = i + 1
+                other = deck[j]
+                deck[i], deck[j] = other, code
+                pos[code], pos[other] = j, i
+            print(label, end=' ')
             self.print_state()
 
         # Triple cut
-        i1, i2 = sorted([self.search(53), self.search(54)])
+        i1, i2 = sorted([pos[53], pos[54]])
         top, mid, bot = (
             self.deck[:i1],
             self.deck[i1 : i2 + 1],
             self.deck[i2 + 1 :]
         )
         self.deck = bot + mid + top
-        if self.verbose:
-            print("After triple cut:", end=' ')
-            self.print_state()
+        self._reindex()
+        print("After triple cut:", end=' ')
+        self.print_state()
 
         # Count cut using bottom card
         bottom = self.deck[-1]
@@ -202,16 +386,40 @@ class Deck:
         self.count_cut(cnt)
         return self
 
-    def next_key_letter(self) -> str:
-        card = 54
-        while card > 52:
-            self.shift_cut()
-            top = self.get_card(0)
-            card = self.get_card(top)
-        letter = chr((card - 1) % 26 + 65)
+    def _next_key_code(self) -> int:
+        # The counted card is a joker only ~2 times in 54, so shuffle once
+        # up front and fall into the retry loop only on that rare miss.
         if self.verbose:
-            print("Next key letter:", letter)
-        return letter
+            # The printing methods trace every intermediate deck state.
+            self.shift_cut()
+            card = self.get_card(self.get_card(0))
+            while card > 52:
+                self.shift_cut()
+                card = self.get_card(self.get_card(0))
+            code = CARD_TO_CODE[card]
+            print("Next key letter:", chr(code + 65))
+            return code
+        deck, scratch, pos = self.deck, self._scratch, self.pos
+        deck, scratch = _shift_cut_kernel(deck, scratch, pos)
+        top = deck[0]
+        card = deck[top if top < 53 else 53]
+        while card > 52:
+            deck, scratch = _shift_cut_kernel(deck, scratch, pos)
+            top = deck[0]
+            card = deck[top if top < 53 else 53]
+        self.deck, self._scratch = deck, scratch
+        return CARD_TO_CODE[card]
+
+    def next_key_letter(self) -> str:
+        return chr(self._next_key_code() + 65)
+
+    def key_stream_bytes(self, n: int) -> bytes:
+        """Generate `n` raw key codes (0–25) in one tight loop."""
+        out = bytearray(n)
+        next_key = self._next_key_code
+        for i in range(n):
+            out[i] = next_key()
+        return bytes(out)
 
     def get_key_stream(self, length: int = 0) -> Generator[str, None, None]:
         i = 0
@@ -219,17 +427,30 @@ class Deck:
             yield self.next_key_letter()
             i += 1
 
+    def combine_bytes(self, data: bytes, sign: int = 1) -> bytes:
+        """
+        Encrypt (`sign=1`) or decrypt (`sign=-1`) letter bytes in one fused
+        pass, producing each key code on demand rather than materializing
+        the whole keystream first.
+        """
+        out = bytearray(data)
+        next_key = self._next_key_code
+        for i, o in enumerate(out):
+            base = (o & 0x60) + 1
+            out[i] = base + (o - base + sign * (next_key() + 1)) % 26
+        return bytes(out)
+
     def encrypt(self, plaintext: str) -> str:
-        return combine_text(plaintext, self.get_key_stream(), sign=1)
+        return self.combine_bytes(_letter_bytes(plaintext), sign=1).decode('ascii')
 
     def decrypt(self, ciphertext: str) -> str:
-        return combine_text(ciphertext, self.get_key_stream(), sign=-1)
+        return self.combine_bytes(_letter_bytes(ciphertext), sign=-1).decode('ascii')
 
     def print_state(self, unicode: bool = True, color: bool = False) -> None:
         """Print the current deck state if verbose is enabled."""
         if not self.verbose:
             return
-        suits = list(SUITS_UNI if unicode else SUITS)
+        suits = SUITS_UNI if unicode else SUITS
         if color:
             suits = [
                 suits[0],
@@ -244,7 +465,7 @@ class Deck:
 def group_text(text: str, size: int) -> str:
     if size <= 0:
         return text
-    return ' '.join(text[i : i + size] for i in range(0, len(text), size))
+    return ' '.join([text[i : i + size] for i in range(0, len(text), size)])
 
 
 def main() -> None:
@@ -292,10 +513,10 @@ def main() -> None:
 
     # Prepare and clean text
     if args.encrypt:
-        cleaned = re.sub(r'[^A-Za-z]', '', args.encrypt).upper()
+        cleaned = args.encrypt.translate(_CLEAN)
         result = deck.encrypt(cleaned)
     else:
-        cleaned = re.sub(r'[^A-Za-z]', '', args.decrypt).upper()  # type: ignore
+        cleaned = args.decrypt.translate(_CLEAN)  # type: ignore
         result = deck.decrypt(cleaned)
 
     # Group and output